@@ -18,7 +18,10 @@ class SolrIndexer:
 
     def __init__(self):
         """Initializes the SolrIndexer."""
+        # One keep-alive session for pysolr and the direct Schema/admin API calls
+        self.session = requests.Session()
         self.solr = pysolr.Solr(SOLR_URL, always_commit=True, timeout=10)
+        self.solr.session = self.session
         self.schema_url = f"{SOLR_URL.rstrip('/')}/schema"
 
     def setup_solr_schema(self) -> bool:
@@ -30,6 +33,28 @@ class SolrIndexer:
         """
         logger.info("Setting up Solr schema...")
         
+        # Field types the fields below need beyond the stock _default ones. The configset
+        # defines them too, but it is only copied when a core is created, so existing
+        # cores get them through the Schema API
+        field_types_to_configure = [
+            {
+                'name': 'text_edge',
+                'class': 'solr.TextField',
+                'positionIncrementGap': '100',
+                'indexAnalyzer': {
+                    'tokenizer': {'name': 'keyword'},
+                    'filters': [
+                        {'name': 'lowercase'},
+                        {'name': 'edgeNGram', 'minGramSize': '2', 'maxGramSize': '15'},
+                    ],
+                },
+                'queryAnalyzer': {
+                    'tokenizer': {'name': 'keyword'},
+                    'filters': [{'name': 'lowercase'}],
+                },
+            },
+        ]
+        
         fields_to_configure = [
         # Field that caused the original error
         {'name': 'pokemon_id', 'type': 'pint', 'multiValued': False, 'docValues': True, 'indexed': False, 'stored': True},
@@ -68,26 +93,56 @@ class SolrIndexer:
         {'name': 'name_spell', 'type': 'text_general', 'indexed': True, 'stored': True, 'multiValued': True, 'termVectors': True},
         {'name': 'spellcheck_base', 'type': 'text_general', 'indexed': True, 'stored': True, 'multiValued': True},
         {'name': 'levelup_moves', 'type': 'strings', 'multiValued': True, 'indexed': True, 'stored': True},
+
+        # Edge n-gram fields for prefix matching without leading wildcards
+        {'name': 'name_edge', 'type': 'text_edge', 'indexed': True, 'stored': False},
+        {'name': 'abilities_edge', 'type': 'text_edge', 'multiValued': True, 'indexed': True, 'stored': False},
     ]
         
         copy_fields_to_configure = [
             {'source': 'name', 'dest': 'name_spell'},
+            {'source': 'name', 'dest': 'name_edge'},
+            {'source': 'all_abilities', 'dest': 'abilities_edge'},
         ]
 
         headers = {'Content-type': 'application/json'}
         
+        for field_type_config in field_types_to_configure:
+            type_name = field_type_config['name']
+            try:
+                # Check if field type already exists
+                response = self.session.get(f"{self.schema_url}/fieldtypes/{type_name}")
+                if response.status_code == 200:
+                    logger.info(f"Field type '{type_name}' already exists. Skipping.")
+                    continue
+                
+                # Add field type
+                payload = {"add-field-type": field_type_config}
+                response = self.session.post(f"{self.schema_url}", headers=headers, data=json.dumps(payload))
+                response.raise_for_status()
+                logger.info(f"Successfully added field type '{type_name}'.")
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 400 and "already exists" in e.response.text:
+                    logger.info(f"Field type '{type_name}' already exists. Skipping.")
+                else:
+                    logger.error(f"Error adding field type '{type_name}': {e}")
+                    return False
+            except Exception as e:
+                logger.error(f"An unexpected error occurred while adding field type '{type_name}': {e}")
+                return False
+        
         for field_config in fields_to_configure:
             field_name = field_config['name']
             try:
                 # Check if field already exists
-                response = requests.get(f"{self.schema_url}/fields/{field_name}")
+                response = self.session.get(f"{self.schema_url}/fields/{field_name}")
                 if response.status_code == 200:
                     logger.info(f"Field '{field_name}' already exists. Skipping.")
                     continue
                 
                 # Add field
                 payload = {"add-field": field_config}
-                response = requests.post(f"{self.schema_url}", headers=headers, data=json.dumps(payload))
+                response = self.session.post(f"{self.schema_url}", headers=headers, data=json.dumps(payload))
                 response.raise_for_status()
                 logger.info(f"Successfully added field '{field_name}'.")
             except requests.exceptions.HTTPError as e:
@@ -107,7 +162,7 @@ class SolrIndexer:
                 # Check if copy field already exists (this is a bit trickier, often easier to just try adding)
                 # Solr will return 400 if it already exists, which we can catch
                 payload = {"add-copy-field": copy_field_config}
-                response = requests.post(f"{self.schema_url}", headers=headers, data=json.dumps(payload))
+                response = self.session.post(f"{self.schema_url}", headers=headers, data=json.dumps(payload))
                 response.raise_for_status()
                 logger.info(f"Successfully added copy field from '{source_field}' to '{dest_field}'.")
             except requests.exceptions.HTTPError as e:
@@ -156,17 +211,20 @@ class SolrIndexer:
     def build_spellcheck_dictionary(self):
         """
         Explicitly builds the spellcheck dictionary in Solr.
+
+        This is a one-time step after indexing; search requests never pass
+        spellcheck.build, since a build on the query path is an index-wide operation.
         """
         logger.info("Building Solr spellcheck dictionary...")
         try:
             # Reload the Solr core to ensure schema changes are picked up
             reload_url = f"{self.solr.url.rsplit('/', 1)[0]}/admin/cores?action=RELOAD&core={self.solr.url.rsplit('/', 1)[1].split('/')[0]}"
-            reload_response = requests.get(reload_url)
+            reload_response = self.session.get(reload_url)
             reload_response.raise_for_status()
             logger.info(f"Solr core reloaded: {reload_response.text}")
 
             # Use the Solr SpellCheckComponent's build command
-            response = requests.get(f"{self.solr.url}/spell?spellcheck.build=true&spellcheck.dictionary=default")
+            response = self.session.get(f"{self.solr.url}/spell?spellcheck.build=true&spellcheck.dictionary=default")
             response.raise_for_status()
             logger.info(f"Solr spellcheck dictionary build response: {response.text}")
             logger.info("Solr spellcheck dictionary built successfully.")
@@ -0,0 +1,27 @@
+"""
+Gunicorn settings for the Pokemon search web app
+
+Threaded (gthread) workers keep serving other requests while one thread waits
+on Solr, so a slow search no longer pins a whole worker process. Every route
+just waits on Solr, so with gevent installed WEB_WORKER_CLASS=gevent swaps the
+threads for greenlets. Gunicorn monkey-patches the stdlib before loading the
+app, so requests/pysolr sockets yield to the event loop.
+
+Usage:
+    gunicorn -c gunicorn.conf.py web_app:app
+    WEB_WORKER_CLASS=gevent gunicorn -c gunicorn.conf.py web_app:app
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+worker_class = os.environ.get('WEB_WORKER_CLASS', 'gthread')
+workers = int(os.environ.get('WEB_WORKERS', min(multiprocessing.cpu_count(), 4)))
+# Threads per worker; stays within the 32-connection Solr session pool
+threads = int(os.environ.get('WEB_THREADS', 16))
+# Concurrent greenlets per gevent worker
+worker_connections = int(os.environ.get('WEB_WORKER_CONNECTIONS', 1000))
+timeout = 30
+keepalive = 5
+reload = os.environ.get('FLASK_ENV') == 'development'
@@ -65,21 +65,57 @@ document.addEventListener('DOMContentLoaded', () => {
     const displayResults = (data) => {
         resultsCountDiv.textContent = `Found ${data.total} results`;
 
-        if (data.spellcheck && data.spellcheck.collated) {
+        spellcheckDiv.innerHTML = '';
+        if (data.total === 0 && data.query && data.query !== '*:*') {
+            // Spellcheck is only worth a request when the search found nothing
+            fetchSpellcheck(data.query);
+        }
+
+        data.results.forEach(pokemon => {
+            const card = document.createElement('div');
+            card.className = 'pokemon-card';
+            card.innerHTML = `
+                <img src="https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/${pokemon.id}.png" alt="${pokemon.name}">
+                <h3>${pokemon.name}</h3>
+                <p>#${pokemon.id}</p>
+                <p style="display: none;">${pokemon.stat_special_attack}</p>
+                <p style="display: none;">${pokemon.stat_special_defense}</p>
+            `;
+            card.addEventListener('click', () => openModal(pokemon.id));
+            resultsGrid.appendChild(card);
+        });
+    };
+
+    // Function to fetch spelling suggestions for a query
+    const fetchSpellcheck = async (query) => {
+        try {
+            const response = await fetch(`/api/spellcheck?q=${encodeURIComponent(query)}`);
+            const data = await response.json();
+            if (data.success) {
+                displaySpellcheck(data.spellcheck);
+            }
+        } catch (error) {
+            console.error('Spellcheck error:', error);
+        }
+    };
+
+    // Function to display spelling suggestions
+    const displaySpellcheck = (spellcheck) => {
+        if (spellcheck && spellcheck.collated) {
             const collatedLink = document.createElement('a');
             collatedLink.href = '#';
-            collatedLink.textContent = data.spellcheck.collated;
+            collatedLink.textContent = spellcheck.collated;
             collatedLink.addEventListener('click', (e) => {
                 e.preventDefault();
-                search(data.spellcheck.collated);
+                search(spellcheck.collated);
             });
             spellcheckDiv.innerHTML = 'Did you mean: ';
             spellcheckDiv.appendChild(collatedLink);
             spellcheckDiv.append('?');
-        } else if (data.spellcheck && data.spellcheck.suggestions.length > 0) {
+        } else if (spellcheck && spellcheck.suggestions.length > 0) {
             const suggestionsHtml = document.createElement('span');
             suggestionsHtml.textContent = 'Did you mean: ';
-            data.spellcheck.suggestions.forEach((s, index) => {
+            spellcheck.suggestions.forEach((s, index) => {
                 const suggestionLink = document.createElement('a');
                 suggestionLink.href = '#';
                 suggestionLink.textContent = s;
@@ -88,7 +124,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     search(s);
                 });
                 suggestionsHtml.appendChild(suggestionLink);
-                if (index < data.spellcheck.suggestions.length - 1) {
+                if (index < spellcheck.suggestions.length - 1) {
                     suggestionsHtml.append(', ');
                 }
             });
@@ -98,20 +134,6 @@ document.addEventListener('DOMContentLoaded', () => {
         } else {
             spellcheckDiv.innerHTML = '';
         }
-
-        data.results.forEach(pokemon => {
-            const card = document.createElement('div');
-            card.className = 'pokemon-card';
-            card.innerHTML = `
-                <img src="https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/${pokemon.id}.png" alt="${pokemon.name}">
-                <h3>${pokemon.name}</h3>
-                <p>#${pokemon.id}</p>
-                <p style="display: none;">${pokemon.stat_special_attack}</p>
-                <p style="display: none;">${pokemon.stat_special_defense}</p>
-            `;
-            card.addEventListener('click', () => openModal(pokemon.id));
-            resultsGrid.appendChild(card);
-        });
     };
 
     // Function to display pagination
@@ -18,35 +18,346 @@ Requirements:
 - requests
 
 Usage:
-    python web_app.py
+    python web_app.py                           (development server)
+    gunicorn -c gunicorn.conf.py web_app:app    (production)
 
 Author: Generated for Pokemon Search Engine Project
 """
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 import pysolr
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import hashlib
 import json
+import re
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to Flask's stdlib JSON provider
+    orjson = None
+
+try:
+    import redis
+except ImportError:  # Optional; without it every cache stays per-process
+    redis = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes with orjson, so every jsonify() response is
+    serialized in C and written as bytes without an intermediate str
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+class TTLCache:
+    """
+    Small thread-safe in-process LRU cache whose entries expire after a fixed time
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)  # Hot keys survive eviction
+            return value
+    
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None):
+        """Store value under key, evicting the least recently used entry when full; ttl overrides the default"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._entries.popitem(last=False)
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+class SingleFlight:
+    """
+    Runs one call per key at a time; concurrent callers asking for the same key
+    wait for that call and share its result instead of repeating it
+    """
+    
+    def __init__(self, timeout: float):
+        self.timeout = timeout  # Longest a caller waits on another caller's call
+        self._calls: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        """Return fn(), or the result of the identical call already in flight"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result(timeout=self.timeout)
+        try:
+            result = fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # Killed rather than failed (gevent Timeout/GreenletExit, SystemExit); the
+            # waiting callers get an ordinary error instead of the kill signal
+            future.set_exception(RuntimeError('Shared lookup was interrupted'))
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+class InvalidSearchParameter(ValueError):
+    """A search parameter that can't be used, answered with 400 instead of 500"""
+
+def int_param(args, name: str, default: Optional[int] = None) -> Optional[int]:
+    """Read an integer request parameter, treating a missing or empty value as default"""
+    value = args.get(name)
+    if value is None or value == '':
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise InvalidSearchParameter(f"'{name}' must be an integer, got {value!r}") from None
+
+class SharedCache:
+    """
+    Cache shared by every worker and instance through Redis. Redis errors and
+    timeouts count as misses, so an unavailable Redis only costs a Solr request.
+    """
+    
+    def __init__(self, url: str, json_provider: DefaultJSONProvider):
+        self._client = redis.Redis.from_url(url, socket_timeout=0.05, socket_connect_timeout=0.05)
+        self._json = json_provider
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the decoded value stored under key, or None on a miss or Redis error"""
+        try:
+            payload = self._client.get(key)
+        except redis.RedisError as e:
+            logger.debug(f"Shared cache read failed: {e}")
+            return None
+        return None if payload is None else self._json.loads(payload)
+    
+    def set(self, key: str, value: Any, ttl: int):
+        """Store value under key for ttl seconds, ignoring Redis errors"""
+        try:
+            self._client.set(key, self._json.dumps(value), ex=ttl)
+        except redis.RedisError as e:
+            logger.debug(f"Shared cache write failed: {e}")
+
+# Characters with meaning in Lucene query syntax, plus whitespace (which would split a term)
+SOLR_SPECIAL_CHARS = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|;\s])')
+
+def escape_solr(value: str) -> str:
+    """Escape user text so it is matched literally inside a Solr query term"""
+    return SOLR_SPECIAL_CHARS.sub(r'\\\1', value)
+
+# Fields the search box may query with field:value syntax (README, Advanced Search)
+USER_QUERY_FIELDS = frozenset({
+    'pokemon_id', 'name', 'primary_type', 'secondary_type', 'types', 'generation',
+    'abilities', 'all_abilities', 'hidden_abilities', 'is_legendary', 'is_mythical',
+    'flavor_text', 'color', 'habitat', 'height', 'weight', 'base_experience', 'capture_rate',
+    'stat_hp', 'stat_attack', 'stat_defense', 'stat_special_attack', 'stat_special_defense',
+    'stat_speed', 'total_stats',
+})
+USER_FIELD_PREFIX = re.compile(r'[(+\-]*([^\s:()"]*):')
+
+def restrict_user_syntax(value: str) -> str:
+    """
+    Keep the documented field:value, phrase, wildcard and boolean syntax of free text, but
+    escape words that query other fields (*:*, _query_, _val_), open local params or are
+    bare wildcards, so they are matched literally
+    """
+    words = []
+    for word in value.split():
+        prefix = USER_FIELD_PREFIX.match(word)
+        if ((prefix and prefix.group(1) not in USER_QUERY_FIELDS) or '{' in word
+                or not word.strip('*?()')):
+            word = escape_solr(word)
+        words.append(word)
+    return ' '.join(words)
+
+def edge_prefix_query(field: str, value: str) -> str:
+    """Build a prefix lookup against an edge n-gram field (name_edge, abilities_edge)"""
+    escaped = value.lower().replace('\\', '\\\\').replace('"', '\\"')
+    return f'{field}:"{escaped}"'
+
 class PokemonSearchApp:
     """
     Flask application for Pokemon search interface
     """
     
+    # Most searches accepted in one /api/msearch request
+    MAX_BATCH_SEARCHES = 32
+    
+    # Seconds browsers and the shared cache may reuse a search response
+    SEARCH_MAX_AGE = 60
+    # Seconds a failed index version lookup is remembered before luke is asked again
+    INDEX_VERSION_RETRY = 5
+    # Seconds an empty vocabulary stands in after a failed load, so an outage doesn't
+    # queue every search behind another 10s facet request
+    VOCABULARY_RETRY = 15
+    
+    # Solr-side time budget (ms), just under the 10s client timeout, so Solr stops work
+    # and returns partial results instead of running on after the client gives up
+    SOLR_TIME_ALLOWED_MS = 9500
+    
+    # Longer autocomplete input is almost always a paste, not a prefix being typed
+    MAX_AUTOCOMPLETE_LENGTH = 40
+    AUTOCOMPLETE_TIMEOUT = 2  # seconds to wait on each autocomplete request to Solr
+    AUTOCOMPLETE_MAX_AGE = 60  # seconds browsers may reuse a suggestion list
+    
+    # Request parameters shared by every search, merged into each request's params
+    FACET_PARAMS = {
+        'facet': 'true',
+        'facet.field': ('generation', 'primary_type', 'color', 'habitat'),
+        'facet.mincount': 1,
+        # A few dozen indexed terms: enumerate them against the filterCache instead of
+        # un-inverting the field (generation is a point field and color/habitat are
+        # docValues-only, so those stay on the default method)
+        'f.primary_type.facet.method': 'enum',
+    }
+    EDISMAX_PARAMS = {
+        'defType': 'edismax',
+        'qf': 'name^5 types^3 all_abilities^3 flavor_text^1',  # Increased ability/type weight
+        'mm': '1',
+        'qs': '2',
+        'ps': '2',
+        'tie': '0.1',
+    }
+    # The empty search box: everything but paging and sort is fixed
+    MATCH_ALL_PARAMS = {'q': '*:*', **FACET_PARAMS}
+    
+    # Longest single word retried as an infix wildcard when its prefix search finds nothing;
+    # name fragments ("chu", "saur", "tortle") are short, longer misses are nearly always
+    # typos, which /api/spellcheck handles without a leading-wildcard scan
+    MAX_INFIX_FALLBACK_LENGTH = 6
+    
+    # Query templates per search strategy, filled from query_fragments()
+    ABILITY_QUERY = '{name_prefix} OR all_abilities:"{title}" OR {ability_prefix}'
+    ABILITY_WILDCARD_QUERY = 'name:*{term}* OR all_abilities:"{title}" OR all_abilities:*{title}*'
+    TYPE_QUERY = '{name_prefix} OR types:*{title}* OR primary_type:{title} OR secondary_type:{title}'
+    TYPE_WILDCARD_QUERY = 'name:*{term}* OR types:*{title}* OR primary_type:{title} OR secondary_type:{title}'
+    NAME_WILDCARD_QUERY = 'name:*{term}* OR name:*{cap}*'
+    
+    # Spellcheck component settings for /api/spellcheck (the /select handler already
+    # includes the component; these mirror the old /spell handler defaults)
+    SPELLCHECK_PARAMS = {
+        'spellcheck': 'true',
+        'spellcheck.dictionary': 'default',
+        'spellcheck.extendedResults': 'true',
+        'spellcheck.count': 10,
+        'spellcheck.alternativeTermCount': 5,
+        'spellcheck.collate': 'true',
+        'spellcheck.maxCollations': 5,
+    }
+    
+    # Stored fields returned for result lists; the detail endpoint still returns every field
+    LIST_FL = ('id,pokemon_id,name,primary_type,secondary_type,types,generation,'
+               'is_legendary,is_mythical,stat_special_attack,stat_special_defense')
+    # Stored Pokemon fields API callers may request with fields=, besides * for everything
+    STORED_FIELDS = frozenset({
+        'id', 'pokemon_id', 'name', 'primary_type', 'secondary_type', 'types', 'generation',
+        'abilities', 'hidden_abilities', 'all_abilities', 'is_legendary', 'is_mythical',
+        'flavor_text', 'color', 'habitat', 'height', 'weight', 'base_experience', 'capture_rate',
+        'evolves_from', 'levelup_moves', 'total_stats', 'stat_hp', 'stat_attack', 'stat_defense',
+        'stat_special_attack', 'stat_special_defense', 'stat_speed',
+    })
+    # Field lists whose match-all pages are cached in memory
+    CACHED_FLS = (LIST_FL, '*')
+    
+    # Suggester dictionaries configured in solrconfig.xml, in display order
+    SUGGEST_DICTIONARIES = ['nameSuggester', 'abilitySuggester', 'typeSuggester']
+    
+    # JSON Facet request computing generation and type buckets alongside the total count
+    STATS_JSON_FACET = json.dumps({
+        'generations': {'type': 'terms', 'field': 'generation', 'limit': -1},
+        'types': {'type': 'terms', 'field': 'primary_type', 'limit': -1, 'mincount': 1}
+    })
+    
     def __init__(self):
         self.app = Flask(__name__)
+        if orjson:
+            self.app.json = OrjsonProvider(self.app)
         self.app.config['SECRET_KEY'] = 'pokemon-search-secret-key'
         
         # Solr configuration
         solr_url = os.environ.get('SOLR_URL', 'http://localhost:8983/solr/pokemon')
-        self.solr = pysolr.Solr(solr_url, always_commit=True, timeout=10)
+        # One pooled keep-alive session for pysolr and the direct handler calls. The app is
+        # built at import time, so each gunicorn worker (without --preload) gets its own pool.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            # Only connection failures are retried; re-sending a query that timed out
+            # would pile more load on an overloaded Solr
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.solr = pysolr.Solr(solr_url, always_commit=False, timeout=10)
+        # pysolr 3.9 has no session argument; it lazily creates its own unless one is set
+        self.solr.session = self.session
+        
+        # Collection stats and unfiltered match-all pages change only on reindex
+        self.stats_cache = TTLCache(maxsize=1, ttl=300)
+        self.match_all_cache = TTLCache(maxsize=64, ttl=60)
+        # Pokemon documents by pokemon_id, for the detail modal
+        self.detail_cache = TTLCache(maxsize=2048, ttl=900)
+        # Cache misses arriving together (a burst of keystrokes, repeated clicks)
+        # share one Solr lookup
+        self.detail_flight = SingleFlight(timeout=15)
+        self.autocomplete_flight = SingleFlight(timeout=15)
+        # Typing a name repeats the same prefixes across users and keystrokes
+        self.autocomplete_cache = TTLCache(maxsize=4096, ttl=300)
+        # Lowercased ability and type names, used to classify queries without a Solr probe
+        self.vocabulary_cache = TTLCache(maxsize=1, ttl=600)
+        self.vocabulary_lock = threading.Lock()
+        # Solr index version, re-read at most every 30s; seeds the search ETags
+        self.index_version_cache = TTLCache(maxsize=1, ttl=30)
+        
+        # Optional second cache level shared across gunicorn workers, behind the
+        # in-process caches; enabled by REDIS_URL
+        redis_url = os.environ.get('REDIS_URL')
+        self.shared_cache = SharedCache(redis_url, self.app.json) if redis and redis_url else None
+        
+        # Runs independent Solr lookups for one request concurrently
+        self.executor = ThreadPoolExecutor(max_workers=4)
         
         # Setup routes
         self.setup_routes()
@@ -64,6 +375,11 @@ class PokemonSearchApp:
             """API endpoint for Pokemon search"""
             return self.search_pokemon()
         
+        @self.app.route('/api/msearch', methods=['POST'])
+        def api_msearch():
+            """API endpoint running several Pokemon searches in one request"""
+            return self.multi_search()
+        
         @self.app.route('/api/pokemon/<int:pokemon_id>')
         def api_pokemon_detail(pokemon_id):
             """API endpoint for individual Pokemon details"""
@@ -78,6 +394,11 @@ class PokemonSearchApp:
         def api_autocomplete():
             """API endpoint for search autocomplete suggestions"""
             return self.get_autocomplete_suggestions()
+        
+        @self.app.route('/api/spellcheck')
+        def api_spellcheck():
+            """API endpoint for spelling suggestions, called when a search finds nothing"""
+            return self.get_spellcheck_suggestions()
     
     def search_pokemon(self) -> Dict[str, Any]:
         """
@@ -87,214 +408,455 @@ class PokemonSearchApp:
             JSON response with search results
         """
         try:
-            # Get search parameters
-            query = request.args.get('q', '') # Default to empty string
-            if not query.strip():
-                query = '*:*' # If query is empty or just whitespace, search all
-            
-            start = int(request.args.get('start', 0))
-            rows = min(int(request.args.get('rows', 20)), 100)  # Max 100 results
-            sort_field = request.args.get('sort', 'pokemon_id')
-            sort_order = request.args.get('order', 'asc')
-            
-            # Filters
-            generation = request.args.get('generation')
-            pokemon_type = request.args.get('type')
-            ability = request.args.get('ability')
-            is_legendary = request.args.get('legendary')
-            
-            # Build Solr filters
-            filters = self.build_solr_filters(
-                generation, pokemon_type, ability, is_legendary
-            )
+            # The same parameters against the same index version give the same results,
+            # so a matching If-None-Match is answered without querying Solr
+            etag = self.search_etag()
+            if etag and request.if_none_match.contains(etag):
+                response = self.app.response_class(status=304)
+            else:
+                # The ETag covers the parameters and the index version, so it also keys the shared cache
+                shared_key = f'search:{etag}' if etag else None
+                result = self.execute_search(request.args, shared_key)
+                response = jsonify(result)
+                if result['partial_results']:
+                    # A truncated page must not be revalidated as if it were complete
+                    response.cache_control.no_store = True
+                    return response
+            if etag:
+                response.set_etag(etag)
+                response.cache_control.public = True
+                response.cache_control.max_age = self.SEARCH_MAX_AGE
+            return response
             
-            # Build sort parameter
-            sort_param = f"{sort_field} {sort_order}"
+        except InvalidSearchParameter as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'total': 0,
+                'results': []
+            }), 400
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'total': 0,
+                'results': []
+            }), 500
+    
+    def query_fragments(self, query: str) -> Dict[str, str]:
+        """
+        Escape the user's query once in each form the query templates need
+        
+        Args:
+            query: Search text as typed
             
-            # IMPROVED QUERY STRATEGY
-            # Always use edismax for better ability/type search, but optimize for different scenarios
-            if query and query != '*:*':
-                query_lower = query.lower().strip()
-                
-                # Check if query matches an ability or type dynamically
-                is_ability = self.check_if_ability(query_lower)
-                is_type = self.check_if_type(query_lower)
-                
-                logger.info(f"Query analysis for '{query}': is_ability={is_ability}, is_type={is_type}")
-                
-                # Enhanced query building based on what the query actually represents
-                if is_ability:
-                    # For abilities, search in ability fields with proper case matching
-                    title_query = query.title()
-                    enhanced_query = f'name:*{query}* OR all_abilities:"{title_query}" OR all_abilities:*{title_query}*'
-                    logger.info(f"Using ability search strategy: {enhanced_query}")
-                elif is_type:
-                    # For types, search in type fields
-                    title_query = query.title()
-                    enhanced_query = f'name:*{query}* OR types:*{title_query}* OR primary_type:{title_query} OR secondary_type:{title_query}'
-                    logger.info(f"Using type search strategy: {enhanced_query}")
-                elif len(query) <= 3 or ' ' not in query:
-                    # Short queries or single words: enhanced wildcard + edismax
-                    enhanced_query = f'name:*{query}* OR name:*{query.capitalize()}*'
-                    logger.info(f"Using short query strategy: {enhanced_query}")
-                else:
-                    # Regular multi-word queries: use original query
-                    enhanced_query = query
-                    logger.info(f"Using standard query strategy: {enhanced_query}")
-                
-                # Use edismax for most queries to leverage field boosting
-                params = {
-                    'q': enhanced_query,
-                    'start': start,
-                    'rows': rows,
-                    'sort': sort_param,
-                    'facet': 'true',
-                    'facet.field': ['generation', 'primary_type', 'color', 'habitat'],
-                    'facet.mincount': 1,
-                    'defType': 'edismax',
-                    'qf': 'name^5 types^3 all_abilities^3 flavor_text^1',  # Increased ability/type weight
-                    'mm': '1',
-                    'qs': '2',
-                    'ps': '2', 
-                    'tie': '0.1',
+        Returns:
+            Template fields: term, title, cap, name_prefix, ability_prefix and free_text
+        """
+        return {
+            'term': escape_solr(query),
+            'title': escape_solr(query.title()),
+            'cap': escape_solr(query.capitalize()),
+            'name_prefix': edge_prefix_query('name_edge', query),
+            'ability_prefix': edge_prefix_query('abilities_edge', query),
+            'free_text': restrict_user_syntax(query),
+        }
+    
+    def get_index_version(self) -> Optional[int]:
+        """
+        Get the current Solr index version, which changes on every commit
+        
+        Returns:
+            Index version, or None when Solr can't report it
+        """
+        version = self.index_version_cache.get('version')
+        if version is None:
+            try:
+                luke_response = self.session.get(
+                    f"{self.solr.url.rstrip('/')}/admin/luke",
+                    params={'numTerms': 0, 'show': 'index', 'wt': 'json'},
+                    timeout=2
+                )
+                luke_response.raise_for_status()
+                version = luke_response.json()['index']['version']
+            except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                logger.warning(f"Could not read index version: {e}")
+                # Remember the miss briefly so searches don't each pay for another luke call
+                self.index_version_cache.set('version', False, ttl=self.INDEX_VERSION_RETRY)
+                return None
+            self.index_version_cache.set('version', version)
+        return None if version is False else version
+    
+    def search_etag(self) -> Optional[str]:
+        """
+        Build the ETag for the current search request from its parameters and the index version
+        
+        Returns:
+            ETag value, or None when the index version is unknown
+        """
+        version = self.get_index_version()
+        if version is None:
+            return None
+        seed = f"{version}?{sorted(request.args.items(multi=True))}"
+        return hashlib.blake2b(seed.encode(), digest_size=16).hexdigest()
+    
+    def multi_search(self) -> Dict[str, Any]:
+        """
+        Run a batch of searches posted as JSON: {"searches": [{"q": ..., "type": ...}, ...]}
+        
+        Returns:
+            JSON response with one search response per entry, in request order
+        """
+        payload = request.get_json(silent=True) or {}
+        searches = payload.get('searches')
+        if not isinstance(searches, list):
+            return jsonify({
+                'success': False,
+                'error': 'Expected a JSON body with a "searches" list',
+                'results': []
+            }), 400
+        if len(searches) > self.MAX_BATCH_SEARCHES:
+            return jsonify({
+                'success': False,
+                'error': f'At most {self.MAX_BATCH_SEARCHES} searches per request',
+                'results': []
+            }), 400
+        
+        results = []
+        for args in searches:
+            start_time = time.perf_counter()
+            try:
+                if not isinstance(args, dict):
+                    raise ValueError('Each search must be an object of query parameters')
+                result = self.execute_search(args)
+            except Exception as e:
+                logger.error(f"Search error: {e}")
+                result = {
+                    'success': False,
+                    'error': str(e),
+                    'total': 0,
+                    'results': []
                 }
+            # Server-side time for this search alone, since the batch shares one round-trip
+            result['query_time'] = time.perf_counter() - start_time
+            results.append(result)
+        
+        return jsonify({
+            'success': True,
+            'results': results
+        })
+    
+    def execute_search(self, args, shared_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run one Pokemon search
+        
+        Args:
+            args: Search parameters (request.args or a dict with the same keys)
+            shared_key: Shared cache key for this search, checked after the in-process caches
+            
+        Returns:
+            Search response dictionary
+        """
+        # Get search parameters
+        query = args.get('q', '') # Default to empty string
+        if not query.strip():
+            query = '*:*' # If query is empty or just whitespace, search all
+        
+        start = int_param(args, 'start', 0)
+        rows = min(int_param(args, 'rows', 20), 100)  # Max 100 results
+        sort_field = args.get('sort', 'pokemon_id')
+        sort_order = args.get('order', 'asc')
+        # Deep paging: a cursorMark ('*' for the first page) replaces start, so Solr only
+        # collects `rows` docs per page instead of sorting and skipping `start` of them
+        cursor_mark = args.get('cursorMark')
+        if cursor_mark is not None:
+            start = 0
+        
+        # Filters
+        generation = int_param(args, 'generation')
+        pokemon_type = args.get('type')
+        ability = args.get('ability')
+        is_legendary = args.get('legendary')
+        
+        # Build Solr filters
+        filters = self.build_solr_filters(
+            generation, pokemon_type, ability, is_legendary
+        )
+        # Prefix lookups on the edge n-gram fields miss infix matches ("chu" in Pikachu),
+        # so a search that finds nothing is retried with the original wildcard clauses
+        wildcard_query = None
+        
+        # Build sort parameter
+        sort_param = f"{sort_field} {sort_order}"
+        if cursor_mark is not None and sort_field != 'id':
+            sort_param += ', id asc'  # cursorMark requires the uniqueKey as a tie-breaker
+        
+        # IMPROVED QUERY STRATEGY
+        # Always use edismax for better ability/type search, but optimize for different scenarios
+        if query and query != '*:*':
+            query_lower = query.lower().strip()
+            
+            # Check if query matches an ability or type dynamically
+            is_ability, is_type = self.classify_query(query_lower)
+            
+            logger.info(f"Query analysis for '{query}': is_ability={is_ability}, is_type={is_type}")
+            
+            # Enhanced query building based on what the query actually represents
+            fragments = self.query_fragments(query)
+            if is_ability:
+                # For abilities, search in ability fields with proper case matching
+                enhanced_query = self.ABILITY_QUERY.format_map(fragments)
+                wildcard_query = self.ABILITY_WILDCARD_QUERY.format_map(fragments)
+                logger.info(f"Using ability search strategy: {enhanced_query}")
+            elif is_type:
+                # For types, search in type fields
+                enhanced_query = self.TYPE_QUERY.format_map(fragments)
+                wildcard_query = self.TYPE_WILDCARD_QUERY.format_map(fragments)
+                logger.info(f"Using type search strategy: {enhanced_query}")
+            elif len(query) <= 3 or ' ' not in query:
+                # Short queries or single words: enhanced wildcard + edismax
+                enhanced_query = fragments['name_prefix']
+                if len(query) <= self.MAX_INFIX_FALLBACK_LENGTH:
+                    wildcard_query = self.NAME_WILDCARD_QUERY.format_map(fragments)
+                logger.info(f"Using short query strategy: {enhanced_query}")
             else:
-                # Empty query - search all
-                params = {
-                    'q': '*:*',
-                    'start': start,
-                    'rows': rows,
-                    'sort': sort_param,
-                    'facet': 'true',
-                    'facet.field': ['generation', 'primary_type', 'color', 'habitat'],
-                    'facet.mincount': 1,
-                }
+                # Regular multi-word queries: the user's own syntax, limited to the searchable fields
+                enhanced_query = fragments['free_text']
+                logger.info(f"Using standard query strategy: {enhanced_query}")
             
-            if filters:
-                params['fq'] = filters # Add filters to the fq parameter
-                
+            # Use edismax for most queries to leverage field boosting
+            params = {
+                'q': enhanced_query,
+                'start': start,
+                'rows': rows,
+                'sort': sort_param,
+                **self.FACET_PARAMS,
+                **self.EDISMAX_PARAMS,
+            }
+        else:
+            # Empty query - search all
+            params = {
+                **self.MATCH_ALL_PARAMS,
+                'start': start,
+                'rows': rows,
+                'sort': sort_param,
+            }
+        
+        if filters:
+            params['fq'] = filters # Add filters to the fq parameter
+        # API callers may ask for other stored fields, e.g. fields=* for full records
+        params['fl'] = self.field_list(args.get('fields'))
+        if cursor_mark is not None:
+            # Solr rejects cursorMark combined with timeAllowed
+            params['cursorMark'] = cursor_mark or '*'
+            del params['start']
+        else:
+            params['timeAllowed'] = self.SOLR_TIME_ALLOWED_MS
+        
+        # The empty search box lands here on every page load; serve its first page from memory
+        match_all_key = None
+        if (query == '*:*' and not filters and start == 0 and cursor_mark is None
+                and params['fl'] in self.CACHED_FLS):
+            match_all_key = (sort_param, rows, params['fl'])
+            cached = self.match_all_cache.get(match_all_key)
+            if cached is not None:
+                return dict(cached)  # Copied so callers can add keys without touching the cache
+        
+        if shared_key and self.shared_cache:
+            response = self.shared_cache.get(shared_key)
+            if response is not None:
+                if match_all_key is not None:
+                    self.match_all_cache.set(match_all_key, dict(response))
+                return response
+        
+        results = self.solr.search(**params)
+        if results.hits == 0 and (wildcard_query or ability):
+            if wildcard_query:
+                params['q'] = wildcard_query
+            if ability:
+                params['fq'] = self.build_solr_filters(
+                    generation, pokemon_type, ability, is_legendary, use_edge=False
+                )
             results = self.solr.search(**params)
+        # Set by Solr when timeAllowed cut the search short
+        partial_results = bool(results.raw_response.get('responseHeader', {}).get('partialResults', False))
 
-            # Fetch spellcheck suggestions separately (unchanged)
+        # Format response
+        response = {
+            'success': True,
+            'total': results.hits,
+            'start': start,
+            'rows': rows,
+            'results': results.docs,
+            'facets': self.format_facets(results.facets) if hasattr(results, 'facets') else {},
+            'partial_results': partial_results,
+            'next_cursor_mark': results.nextCursorMark,
+            'query': query,
+            # Filled in by /api/spellcheck, which the frontend only calls for empty results
+            'spellcheck': {
+                'suggestions': [],
+                'collated': None,
+            },
+            'filters': {
+                'generation': generation,
+                'type': pokemon_type,
+                'ability': ability,
+                'legendary': is_legendary
+            }
+        }
+        
+        if partial_results:
+            return response  # Never cache a page timeAllowed cut short
+        if match_all_key is not None:
+            self.match_all_cache.set(match_all_key, dict(response))
+        if shared_key and self.shared_cache:
+            self.shared_cache.set(shared_key, response, self.SEARCH_MAX_AGE)
+        return response
+    
+    def field_list(self, fields: Optional[str]) -> str:
+        """
+        Build the Solr fl parameter from a comma-separated fields request parameter
+        
+        Args:
+            fields: Requested stored field names, or * for every stored field
+            
+        Returns:
+            Solr field list; the summary LIST_FL when no fields were requested
+        """
+        if not fields:
+            return self.LIST_FL
+        if not isinstance(fields, str):
+            raise InvalidSearchParameter("'fields' must be a comma-separated list of field names")
+        names = [name.strip() for name in fields.split(',') if name.strip()]
+        if not names:
+            raise InvalidSearchParameter("'fields' must name at least one field")
+        unknown = [name for name in names if name != '*' and name not in self.STORED_FIELDS]
+        if unknown:
+            raise InvalidSearchParameter(f"Unknown fields: {', '.join(unknown)}")
+        return ','.join(dict.fromkeys(names))
+    
+    def get_spellcheck_suggestions(self) -> Dict[str, Any]:
+        """
+        Get spelling suggestions for a search query
+        
+        Returns:
+            JSON response with suggested words and the collated query
+        """
+        query = request.args.get('q', '').strip()
+        if not query or query == '*:*':
+            return jsonify({
+                'success': True,
+                'spellcheck': {'suggestions': [], 'collated': None}
+            })
+        
+        try:
+            # rows=0: only the spellcheck component's output is needed
+            results = self.solr.search(query, **{
+                'rows': 0,
+                **self.SPELLCHECK_PARAMS,
+                'spellcheck.q': query,
+            })
+            
             suggestions = []
             collated_suggestion = None
-            if query.strip() and query != '*:*':
-                spellcheck_params = {
-                    'q': query,
-                    'spellcheck': 'true',
-                    'spellcheck.build': 'true',
-                    'spellcheck.collate': 'true',
-                    'spellcheck.maxCollations': 5,
-                    'spellcheck.dictionary': 'default',
-                    'spellcheck.extendedResults': 'true',
-                    'wt': 'json'
-                }
-                try:
-                    spellcheck_response = requests.get(f"{self.solr.url.rstrip('/')}/spell", params=spellcheck_params)
-                    spellcheck_response.raise_for_status()
-                    spellcheck_data = spellcheck_response.json()
-
-                    if spellcheck_data.get('spellcheck') and spellcheck_data['spellcheck'].get('suggestions'):
-                        for item in spellcheck_data['spellcheck']['suggestions']:
-                            if isinstance(item, dict) and item.get('suggestion'):
-                                suggestions.extend([s['word'] for s in item['suggestion']])
-                        
-                        if spellcheck_data['spellcheck'].get('collations'):
-                            collations_list = spellcheck_data['spellcheck']['collations']
-                            if len(collations_list) > 1 and isinstance(collations_list[1], str):
-                                collated_suggestion = collations_list[1]
-                            elif len(collations_list) > 0 and isinstance(collations_list[0], str):
-                                collated_suggestion = collations_list[0]
-                except requests.exceptions.RequestException as e:
-                    logger.error(f"Error fetching spellcheck suggestions: {e}")
-
-            # Format response
-            response = {
+            spellcheck_data = results.raw_response.get('spellcheck')
+            if spellcheck_data and spellcheck_data.get('suggestions'):
+                for item in spellcheck_data['suggestions']:
+                    if isinstance(item, dict) and item.get('suggestion'):
+                        suggestions.extend([s['word'] for s in item['suggestion']])
+                
+                if spellcheck_data.get('collations'):
+                    collations_list = spellcheck_data['collations']
+                    if len(collations_list) > 1 and isinstance(collations_list[1], str):
+                        collated_suggestion = collations_list[1]
+                    elif len(collations_list) > 0 and isinstance(collations_list[0], str):
+                        collated_suggestion = collations_list[0]
+            
+            return jsonify({
                 'success': True,
-                'total': results.hits,
-                'start': start,
-                'rows': rows,
-                'results': [dict(doc) for doc in results.docs],
-                'facets': self.format_facets(results.facets) if hasattr(results, 'facets') else {},
-                'query': query,
                 'spellcheck': {
                     'suggestions': suggestions,
                     'collated': collated_suggestion,
-                },
-                'filters': {
-                    'generation': generation,
-                    'type': pokemon_type,
-                    'ability': ability,
-                    'legendary': is_legendary
                 }
-            }
-            
-            return jsonify(response)
+            })
             
         except Exception as e:
-            logger.error(f"Search error: {e}")
+            logger.error(f"Spellcheck error: {e}")
             return jsonify({
                 'success': False,
-                'error': str(e),
-                'total': 0,
-                'results': []
+                'error': str(e)
             }), 500
     
-    def check_if_ability(self, query: str) -> bool:
+    def get_vocabulary(self) -> Dict[str, frozenset]:
         """
-        Check if the query matches any ability in the database
+        Get every ability and type name in the index, lowercased
         
-        Args:
-            query: Search query in lowercase
-            
         Returns:
-            True if query matches an ability
+            Dictionary with 'abilities' and 'types' sets, both empty when Solr can't be read
         """
-        try:
-            # Quick check using facets to see if this ability exists
-            title_query = query.title()
-            results = self.solr.search(
-                f'all_abilities:"{title_query}"',
-                rows=0,  # We only care about count
-                facet='true',
-                facet_field='all_abilities',
-                facet_mincount=1
-            )
-            logger.info(f"Ability check for '{query}' ('{title_query}'): {results.hits} hits")
-            return results.hits > 0
-        except Exception as e:
-            logger.warning(f"Error checking ability: {e}")
-            return False
+        vocabulary = self.vocabulary_cache.get('vocabulary')
+        if vocabulary is not None:
+            return vocabulary
+        
+        with self.vocabulary_lock:
+            # Another request may have refreshed it while this one waited for the lock
+            vocabulary = self.vocabulary_cache.get('vocabulary')
+            if vocabulary is not None:
+                return vocabulary
+            
+            try:
+                results = self.solr.search(
+                    '*:*',
+                    rows=0,
+                    facet='true',
+                    timeAllowed=self.SOLR_TIME_ALLOWED_MS,
+                    **{
+                        'facet.field': ['all_abilities', 'primary_type', 'secondary_type'],
+                        'facet.limit': -1,
+                        'facet.mincount': 1,
+                    }
+                )
+            except Exception as e:
+                logger.warning(f"Error loading ability/type vocabulary: {e}")
+                # Nothing classifies as an ability or type until the retry; the general
+                # query strategies still apply
+                vocabulary = {'abilities': frozenset(), 'types': frozenset()}
+                self.vocabulary_cache.set('vocabulary', vocabulary, ttl=self.VOCABULARY_RETRY)
+                return vocabulary
+            
+            # Facet values come as [value1, count1, value2, count2, ...]
+            facet_fields = results.facets.get('facet_fields', {})
+            vocabulary = {
+                'abilities': frozenset(
+                    value.lower() for value in facet_fields.get('all_abilities', [])[0::2]
+                ),
+                'types': frozenset(
+                    value.lower()
+                    for field in ('primary_type', 'secondary_type')
+                    for value in facet_fields.get(field, [])[0::2]
+                ),
+            }
+            self.vocabulary_cache.set('vocabulary', vocabulary)
+            logger.info(f"Loaded {len(vocabulary['abilities'])} abilities and {len(vocabulary['types'])} types")
+            return vocabulary
     
-    def check_if_type(self, query: str) -> bool:
+    def classify_query(self, query: str) -> Tuple[bool, bool]:
         """
-        Check if the query matches any type in the database
+        Check if the query matches any ability or type in the database
         
         Args:
             query: Search query in lowercase
             
         Returns:
-            True if query matches a type
+            (is_ability, is_type) tuple
         """
-        try:
-            # Quick check using facets to see if this type exists
-            title_query = query.title()
-            results = self.solr.search(
-                f'(primary_type:{title_query} OR secondary_type:{title_query})',
-                rows=0,  # We only care about count
-                facet='true',
-                facet_field=['primary_type', 'secondary_type'],
-                facet_mincount=1
-            )
-            logger.info(f"Type check for '{query}' ('{title_query}'): {results.hits} hits")
-            return results.hits > 0
-        except Exception as e:
-            logger.warning(f"Error checking type: {e}")
-            return False
+        vocabulary = self.get_vocabulary()
+        return query in vocabulary['abilities'], query in vocabulary['types']
     
-    def build_solr_filters(self, generation: Optional[str], 
+    def build_solr_filters(self, generation: Optional[int], 
                         pokemon_type: Optional[str], ability: Optional[str],
-                        is_legendary: Optional[str]) -> List[str]:
+                        is_legendary: Optional[str], use_edge: bool = True) -> List[str]:
         """
         Build Solr filter query strings
         
@@ -303,6 +865,7 @@ class PokemonSearchApp:
             pokemon_type: Type filter
             ability: Ability filter
             is_legendary: Legendary filter
+            use_edge: Match ability as a prefix on abilities_edge instead of an infix wildcard
             
         Returns:
             List of Solr filter query strings
@@ -310,14 +873,18 @@ class PokemonSearchApp:
         filters = []
         
         # Add filters
-        if generation:
+        if generation is not None:
             filters.append(f'generation:{generation}')
         
         if pokemon_type:
-            filters.append(f'(primary_type:{pokemon_type} OR secondary_type:{pokemon_type})')
+            type_term = escape_solr(pokemon_type)
+            filters.append(f'(primary_type:{type_term} OR secondary_type:{type_term})')
         
         if ability:
-            filters.append(f'all_abilities:*{ability}*')
+            if use_edge:
+                filters.append(edge_prefix_query('abilities_edge', ability))
+            else:
+                filters.append(f'all_abilities:*{escape_solr(ability)}*')
         
         if is_legendary:
             if is_legendary.lower() in ['true', '1', 'yes']:
@@ -332,27 +899,21 @@ class PokemonSearchApp:
         Format Solr facets for JSON response
         
         Args:
-            facets: Raw facets from Solr
+            facets: Solr facet_counts section, holding the facet_fields counts
             
         Returns:
             Formatted facets dictionary
         """
-        formatted = {}
-        
-        for field, values in facets.items():
-            if field.endswith('_facet') or not isinstance(values, list):
-                continue
-            
-            formatted[field] = []
-            # Facet values come as [value1, count1, value2, count2, ...]
-            for i in range(0, len(values), 2):
-                if i + 1 < len(values):
-                    formatted[field].append({
-                        'value': values[i],
-                        'count': values[i + 1]
-                    })
-        
-        return formatted
+        # Facet values come as [value1, count1, value2, count2, ...]; zipping one
+        # iterator with itself pairs them without copying the list into slices
+        return {
+            field: [
+                {'value': value, 'count': count}
+                for value, count in zip(*[iter(values)] * 2)
+            ]
+            for field, values in facets.get('facet_fields', {}).items()
+            if not field.endswith('_facet')
+        }
     
     def get_pokemon_detail(self, pokemon_id: int) -> Dict[str, Any]:
         """
@@ -365,14 +926,18 @@ class PokemonSearchApp:
             JSON response with Pokemon details
         """
         try:
-            results = self.solr.search(f'pokemon_id:{pokemon_id}')
+            pokemon = self.detail_cache.get(pokemon_id)
+            if pokemon is None:
+                pokemon = self.detail_flight.do(pokemon_id, lambda: self.fetch_pokemon_detail(pokemon_id))
             
-            if results.hits > 0:
-                pokemon = dict(results.docs[0])
-                return jsonify({
+            if pokemon is not None:
+                response = jsonify({
                     'success': True,
                     'pokemon': pokemon
                 })
+                response.cache_control.public = True
+                response.cache_control.max_age = self.detail_cache.ttl
+                return response
             else:
                 return jsonify({
                     'success': False,
@@ -386,6 +951,23 @@ class PokemonSearchApp:
                 'error': str(e)
             }), 500
     
+    def fetch_pokemon_detail(self, pokemon_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one Pokemon document from Solr and cache it
+        
+        Args:
+            pokemon_id: Pokemon ID
+            
+        Returns:
+            The Pokemon document, or None when there is no such Pokemon
+        """
+        results = self.solr.search(f'pokemon_id:{pokemon_id}')
+        if results.hits == 0:
+            return None
+        pokemon = results.docs[0]
+        self.detail_cache.set(pokemon_id, pokemon)
+        return pokemon
+    
     def get_search_stats(self) -> Dict[str, Any]:
         """
         Get general statistics about the Pokemon collection
@@ -393,39 +975,43 @@ class PokemonSearchApp:
         Returns:
             JSON response with stats
         """
+        cached = self.stats_cache.get('stats')
+        if cached is not None:
+            return self.conditional_response(cached, self.stats_cache.ttl)
+        
         try:
-            # Total count
-            total_results = self.solr.search('*:*', rows=0)
-            total_count = total_results.hits
+            # Total count, generation counts and type distribution in one request
+            results = self.solr.search(
+                '*:*',
+                rows=0,
+                timeAllowed=self.SOLR_TIME_ALLOWED_MS,
+                **{'json.facet': self.STATS_JSON_FACET}
+            )
+            total_count = results.hits
+            facets = results.raw_response.get('facets', {})
             
-            # Generation counts
+            gen_counts = {
+                str(bucket['val']): bucket['count']
+                for bucket in facets.get('generations', {}).get('buckets', [])
+            }
             gen_stats = {}
             for gen in [1, 2, 3]:
-                gen_results = self.solr.search(f'generation:{gen}', rows=0)
-                gen_stats[f'generation_{gen}'] = gen_results.hits
+                gen_stats[f'generation_{gen}'] = gen_counts.get(str(gen), 0)
             
             # Type distribution
-            type_results = self.solr.search(
-                '*:*', 
-                rows=0, 
-                facet='true', 
-                facet_field='primary_type',
-                facet_mincount=1
-            )
-            
-            type_stats = {}
-            if hasattr(type_results, 'facets') and 'primary_type' in type_results.facets:
-                types = type_results.facets['primary_type']
-                for i in range(0, len(types), 2):
-                    if i + 1 < len(types):
-                        type_stats[types[i]] = types[i + 1]
+            type_stats = {
+                bucket['val']: bucket['count']
+                for bucket in facets.get('types', {}).get('buckets', [])
+            }
             
-            return jsonify({
+            stats = {
                 'success': True,
                 'total_pokemon': total_count,
                 'generation_stats': gen_stats,
                 'type_distribution': type_stats
-            })
+            }
+            self.stats_cache.set('stats', stats)
+            return self.conditional_response(stats, self.stats_cache.ttl)
             
         except Exception as e:
             logger.error(f"Stats error: {e}")
@@ -434,6 +1020,24 @@ class PokemonSearchApp:
                 'error': str(e)
             }), 500
     
+    def conditional_response(self, payload: Dict[str, Any], max_age: int):
+        """
+        Build a JSON response that browsers and proxies may cache and revalidate
+        
+        Args:
+            payload: Response body
+            max_age: Seconds the response may be reused without revalidating
+            
+        Returns:
+            JSON response with Cache-Control and ETag set
+        """
+        response = jsonify(payload)
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+        # Content-hash ETag; a matching If-None-Match becomes an empty 304
+        response.add_etag()
+        return response.make_conditional(request)
+    
     def get_autocomplete_suggestions(self) -> Dict[str, Any]:
         """
         Get autocomplete suggestions based on partial query
@@ -443,94 +1047,25 @@ class PokemonSearchApp:
         """
         try:
             query = request.args.get('q', '').strip()
-            if not query or len(query) < 2:
-                return jsonify({
-                    'success': True,
-                    'suggestions': []
-                })
-            
-            suggestions = []
-            
-            # Get term suggestions from Solr using terms component
-            try:
-                terms_params = {
-                    'terms': 'true',
-                    'terms.fl': 'name,name_spell,types,all_abilities',
-                    'terms.prefix': query.lower(),
-                    'terms.limit': 15,
-                    'wt': 'json'
-                }
-                
-                terms_response = requests.get(f"{self.solr.url.rstrip('/')}/terms", params=terms_params)
-                terms_response.raise_for_status()
-                terms_data = terms_response.json()
-                
-                logger.info(f"Terms component returned: {len(terms_data.get('terms', {}))} fields")
-                
-                if terms_data.get('terms'):
-                    for field, terms_list in terms_data['terms'].items():
-                        if isinstance(terms_list, list):
-                            # Terms come as [term1, count1, term2, count2, ...]
-                            field_suggestions = 0
-                            for i in range(0, len(terms_list), 2):
-                                if i < len(terms_list):
-                                    term = terms_list[i]
-                                    # Case-insensitive matching for terms
-                                    if term.lower().startswith(query.lower()) and term not in suggestions:
-                                        suggestions.append(term)
-                                        field_suggestions += 1
-                            logger.info(f"Field '{field}' contributed {field_suggestions} suggestions")
-                                        
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Terms request failed: {e}")
-            
-            # Get Pokemon name suggestions using simple wildcard matching
-            try:
-                # Use the same successful wildcard approach as main search
-                wildcard_query = f'name:*{query}* OR name:*{query.capitalize()}*'
-                
-                name_params = {
-                    'q': wildcard_query,
-                    'rows': 15,  # Limit for autocomplete
-                    'fl': 'name',
-                    'wt': 'json'
-                }
-                
-                name_response = requests.get(f"{self.solr.url.rstrip('/')}/select", params=name_params)
-                name_response.raise_for_status()
-                name_data = name_response.json()
-                
-                logger.info(f"Autocomplete wildcard search returned {name_data.get('response', {}).get('numFound', 0)} results")
-                
-                if name_data.get('response', {}).get('docs'):
-                    # Separate prefix matches and substring matches for better ordering
-                    prefix_matches = []
-                    substring_matches = []
-                    
-                    for doc in name_data['response']['docs']:
-                        name = doc.get('name', '')
-                        if name and query.lower() in name.lower() and name not in suggestions:
-                            if name.lower().startswith(query.lower()):
-                                prefix_matches.append(name)
-                            else:
-                                substring_matches.append(name)
-                    
-                    # Add prefix matches first (higher priority), then substring matches
-                    suggestions.extend(prefix_matches)
-                    suggestions.extend(substring_matches)
-                    
-                    logger.info(f"Added {len(prefix_matches)} prefix matches and {len(substring_matches)} substring matches")
-                            
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Name search failed: {e}")
-            
-            # Remove duplicates and limit results
-            unique_suggestions = list(dict.fromkeys(suggestions))[:8]
+            if not query or len(query) < 2 or len(query) > self.MAX_AUTOCOMPLETE_LENGTH:
+                suggestions = []
+            else:
+                cache_key = query.lower()
+                suggestions = self.autocomplete_cache.get(cache_key)
+                if suggestions is None:
+                    suggestions, complete = self.autocomplete_flight.do(
+                        cache_key, lambda: self.fetch_autocomplete_suggestions(query)
+                    )
+                    if not complete:
+                        # A lookup failed; serve what came back but let nothing keep it
+                        response = jsonify({'success': True, 'suggestions': suggestions})
+                        response.cache_control.no_store = True
+                        return response
             
-            return jsonify({
+            return self.conditional_response({
                 'success': True,
-                'suggestions': unique_suggestions
-            })
+                'suggestions': suggestions
+            }, self.AUTOCOMPLETE_MAX_AGE)
             
         except Exception as e:
             logger.error(f"Autocomplete error: {e}")
@@ -539,6 +1074,206 @@ class PokemonSearchApp:
                 'error': str(e),
                 'suggestions': []
             }), 500
+    
+    def fetch_autocomplete_suggestions(self, query: str) -> Tuple[List[str], bool]:
+        """
+        Fetch autocomplete suggestions from the shared cache or Solr and cache them
+        
+        Args:
+            query: Partial query typed by the user
+            
+        Returns:
+            List of suggestions, and whether every lookup succeeded; only complete
+            results are cached
+        """
+        shared_key = f'autocomplete:{query.lower()}'
+        suggestions = self.shared_cache.get(shared_key) if self.shared_cache else None
+        if suggestions is None:
+            suggestions = self.fetch_suggester_suggestions(query)
+            complete = True
+            if suggestions is None:
+                suggestions, complete = self.fetch_terms_suggestions(query)
+            if not complete:
+                return suggestions, False
+            if self.shared_cache:
+                self.shared_cache.set(shared_key, suggestions, self.autocomplete_cache.ttl)
+        self.autocomplete_cache.set(query.lower(), suggestions)
+        return suggestions, True
+    
+    def fetch_suggester_suggestions(self, query: str) -> Optional[List[str]]:
+        """
+        Get autocomplete suggestions from the Solr Suggester in one request
+        
+        Args:
+            query: Partial query typed by the user
+            
+        Returns:
+            Up to 8 suggestions, or None when the /suggest handler is unavailable
+        """
+        try:
+            suggest_params = {
+                'suggest.q': query,
+                'suggest.dictionary': self.SUGGEST_DICTIONARIES,
+                'suggest.count': 8,
+                'suggest.build': 'false',
+                'wt': 'json'
+            }
+            suggest_response = self.session.get(f"{self.solr.url.rstrip('/')}/suggest", params=suggest_params, timeout=self.AUTOCOMPLETE_TIMEOUT)
+            suggest_response.raise_for_status()
+            suggest_data = suggest_response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"Suggest request failed, falling back to terms lookup: {e}")
+            return None
+        
+        # Dictionaries come back in request order: names first, then abilities and types
+        suggestions = []
+        for dictionary in self.SUGGEST_DICTIONARIES:
+            entry = suggest_data.get('suggest', {}).get(dictionary, {}).get(query, {})
+            suggestions.extend(item['term'] for item in entry.get('suggestions', []))
+        return list(dict.fromkeys(suggestions))[:8]
+    
+    def fetch_terms_suggestions(self, query: str) -> Tuple[List[str], bool]:
+        """
+        Get autocomplete suggestions from the terms component and a name search
+        
+        Args:
+            query: Partial query typed by the user
+            
+        Returns:
+            Up to 8 suggestions, and whether both lookups succeeded
+        """
+        # The two lookups are independent, so run them side by side on the shared session
+        terms_future = self.executor.submit(self.fetch_term_prefixes, query)
+        names_future = self.executor.submit(self.fetch_name_matches, query)
+        
+        suggestions = []
+        complete = True
+        for future, label in ((terms_future, 'Terms request'), (names_future, 'Name search')):
+            try:
+                matches = future.result(timeout=self.AUTOCOMPLETE_TIMEOUT)
+            except TimeoutError:
+                logger.warning(f"{label} timed out")
+                matches = None
+            if matches is None:
+                complete = False
+            else:
+                suggestions.extend(matches)
+        
+        # Remove duplicates and limit results
+        return list(dict.fromkeys(suggestions))[:8], complete
+    
+    def fetch_term_prefixes(self, query: str) -> Optional[List[str]]:
+        """
+        Get indexed terms starting with the query from the terms component
+        
+        Args:
+            query: Partial query typed by the user
+            
+        Returns:
+            Matching terms across name, type and ability fields, or None when the
+            request failed
+        """
+        suggestions = []
+        seen = set()
+        query_lower = query.lower()
+        
+        # Get term suggestions from Solr using terms component
+        try:
+            terms_params = {
+                'terms': 'true',
+                'terms.fl': 'name,name_spell,types,all_abilities',
+                'terms.prefix': query.lower(),
+                'terms.limit': 15,
+                'wt': 'json'
+            }
+            
+            terms_response = self.session.get(f"{self.solr.url.rstrip('/')}/terms", params=terms_params, timeout=self.AUTOCOMPLETE_TIMEOUT)
+            terms_response.raise_for_status()
+            terms_data = terms_response.json()
+            
+            logger.info(f"Terms component returned: {len(terms_data.get('terms', {}))} fields")
+            
+            if terms_data.get('terms'):
+                for field, terms_list in terms_data['terms'].items():
+                    if isinstance(terms_list, list):
+                        # Terms come as [term1, count1, term2, count2, ...]
+                        field_suggestions = 0
+                        for term in terms_list[0::2]:
+                            # Case-insensitive matching for terms
+                            if term.lower().startswith(query_lower) and term not in seen:
+                                seen.add(term)
+                                suggestions.append(term)
+                                field_suggestions += 1
+                        logger.info(f"Field '{field}' contributed {field_suggestions} suggestions")
+                                    
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"Terms request failed: {e}")
+            return None
+        
+        return suggestions
+    
+    def fetch_name_matches(self, query: str) -> Optional[List[str]]:
+        """
+        Get Pokemon names containing the query, prefix matches first
+        
+        Args:
+            query: Partial query typed by the user
+            
+        Returns:
+            Matching Pokemon names, or None when the search failed
+        """
+        suggestions = []
+        seen = set()
+        query_lower = query.lower()
+        
+        # Get Pokemon name suggestions from the edge n-gram field
+        try:
+            name_params = {
+                'q': edge_prefix_query('name_edge', query),
+                'rows': 15,  # Limit for autocomplete
+                'fl': 'name',
+                'timeAllowed': self.SOLR_TIME_ALLOWED_MS,
+                'wt': 'json'
+            }
+            
+            name_response = self.session.get(f"{self.solr.url.rstrip('/')}/select", params=name_params, timeout=self.AUTOCOMPLETE_TIMEOUT)
+            name_response.raise_for_status()
+            name_data = name_response.json()
+            
+            if not name_data.get('response', {}).get('numFound'):
+                # No prefix match; fall back to the same wildcard approach as main search
+                name_params['q'] = self.NAME_WILDCARD_QUERY.format_map(self.query_fragments(query))
+                name_response = self.session.get(f"{self.solr.url.rstrip('/')}/select", params=name_params, timeout=self.AUTOCOMPLETE_TIMEOUT)
+                name_response.raise_for_status()
+                name_data = name_response.json()
+            
+            logger.info(f"Autocomplete wildcard search returned {name_data.get('response', {}).get('numFound', 0)} results")
+            
+            if name_data.get('response', {}).get('docs'):
+                # Separate prefix matches and substring matches for better ordering
+                prefix_matches = []
+                substring_matches = []
+                
+                for doc in name_data['response']['docs']:
+                    name = doc.get('name', '')
+                    if name and query_lower in name.lower() and name not in seen:
+                        seen.add(name)
+                        if name.lower().startswith(query_lower):
+                            prefix_matches.append(name)
+                        else:
+                            substring_matches.append(name)
+                
+                # Add prefix matches first (higher priority), then substring matches
+                suggestions.extend(prefix_matches)
+                suggestions.extend(substring_matches)
+                
+                logger.info(f"Added {len(prefix_matches)} prefix matches and {len(substring_matches)} substring matches")
+                        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"Name search failed: {e}")
+            return None
+        
+        return suggestions
 
 # Create Flask app instance
 pokemon_app = PokemonSearchApp()
@@ -556,5 +1291,8 @@ if __name__ == '__main__':
     # Run the app
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV') == 'development'
+    if not debug:
+        logger.warning("The Flask development server handles requests one thread at a time; "
+                       "use: gunicorn -c gunicorn.conf.py web_app:app")
     
     app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file